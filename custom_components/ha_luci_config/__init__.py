@@ -2,7 +2,9 @@
 import asyncio
 import logging
 import glob
+import re
 import string
+import time
 from datetime import timedelta
 
 from openwrt_luci_rpc.openwrt_luci_rpc import OpenWrtLuciRPC # pylint: disable=import-error
@@ -23,6 +25,7 @@ from homeassistant.const import ( # pylint: disable=import-error
     CONF_SCAN_INTERVAL
 )
 import homeassistant.helpers.config_validation as cv # pylint: disable=import-error
+from homeassistant.util import Throttle # pylint: disable=import-error
 
 from homeassistant.helpers.dispatcher import ( # pylint: disable=import-error
     async_dispatcher_send,
@@ -32,13 +35,23 @@ from .const import (
     DOMAIN,
     SIGNAL_STATE_UPDATED,
     CONF_RULE_IDS,
+    MIN_TIME_BETWEEN_COUNTER_UPDATES,
+    FIREWALL_COUNTERS_CMD,
+    COUNTED_SECTION_TYPES,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = ["switch"]
+PLATFORMS = ["switch", "sensor"]
 UPDATE_UNLISTENER = None
 
+# iptables-save -c: [packets:bytes] -A chain ... --comment "!fw3: name"
+IPT_COUNTER_RE = re.compile(r'^\[(\d+):(\d+)\].*--comment "!fw3: ((?:[^"\\]|\\.)*)"')
+# nft list table: ... counter packets N bytes N ... comment "!fw4: name"
+NFT_COUNTER_RE = re.compile(r'counter packets (\d+) bytes (\d+).*comment "!fw4: ((?:[^"\\]|\\.)*)"')
+# Both tools backslash-escape quotes and backslashes inside the comment
+COMMENT_ESCAPE_RE = re.compile(r'\\(.)')
+
 async def async_setup(hass: HomeAssistant, config: dict):
     if DOMAIN not in hass.data:
         hass.data[DOMAIN] = {}
@@ -121,6 +134,18 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
     #         vpn.enabled = openvpn_result[vpn_entry]["enabled"] == "1"
 
     firewall_result = await hass.async_add_executor_job(_rpc.rpc_call, 'get_all', 'firewall')
+
+    # fw3/fw4 label anonymous sections as "@<type>[<index among that type>]"
+    section_labels = {}
+    type_count = {}
+    for section in sorted(firewall_result.values(), key=lambda s: s.get(".index", 0)):
+        section_type = section.get(".type", "")
+        if section.get(".anonymous"):
+            section_labels[section[".name"]] = "@%s[%d]" % (section_type, type_count.get(section_type, 0))
+        else:
+            section_labels[section[".name"]] = section[".name"]
+        type_count[section_type] = type_count.get(section_type, 0) + 1
+
     for rule_entry in firewall_result:
         _LOGGER.debug("Luci: rule %s: %s", rule_entry, firewall_result[rule_entry])
         if config.get(CONF_RULE_IDS) == "" or firewall_result[rule_entry][".name"] in str(config.get(CONF_RULE_IDS)).split():
@@ -131,7 +156,9 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry):
                 rule =_rpc.rule[firewall_result[rule_entry][".name"]] = LuciConfigItem()
 
             rule.id = firewall_result[rule_entry][".name"]
+            rule.type = firewall_result[rule_entry].get(".type", "")
             rule.name = firewall_result[rule_entry]["name"] if "name" in firewall_result[rule_entry] else firewall_result[rule_entry][".name"]
+            rule.label = firewall_result[rule_entry]["name"] if "name" in firewall_result[rule_entry] else section_labels[rule.id]
             if "enabled" not in firewall_result[rule_entry]:
                 rule.enabled = True
             else:
@@ -196,7 +223,13 @@ class LuciConfigItem():
     def __init__(self):
         self.id = ""
         self.name = ""
+        self.type = ""
+        self.label = ""
         self.enabled = False
+        self.packets = None
+        self.bytes = None
+        self.packet_rate = None
+        self.byte_rate = None
 
     def __repr__(self):
         return self.name
@@ -232,6 +265,8 @@ class LuciRPC():
         self.cfg = {}
         self.vpn = {}
         self.rule = {}
+        self._counters_time = None
+        self.counters_available = False
 
     def rpc_call(self, method, *args,  **kwargs):
         rpc_uci_call = Constants.LUCI_RPC_UCI_PATH.format(
@@ -245,3 +280,76 @@ class LuciRPC():
 
         return rpc_result
 
+    def sys_call(self, method, *args,  **kwargs):
+        rpc_sys_call = Constants.LUCI_RPC_SYS_PATH.format(
+            self._rpc.host_api_url), method, *args
+        try:
+            rpc_result = self._rpc._call_json_rpc(*rpc_sys_call)
+        except InvalidLuciTokenError:
+            _LOGGER.info("Refreshing login token")
+            self._rpc._refresh_token()
+            return self.sys_call(method, *args)
+
+        return rpc_result
+
+    @Throttle(MIN_TIME_BETWEEN_COUNTER_UPDATES)
+    def update_counters(self):
+        """Fetch the hit counters of all tracked rules in one exec call."""
+        try:
+            output = self.sys_call("exec", FIREWALL_COUNTERS_CMD)
+        except:
+            _LOGGER.error("Cannot fetch firewall counters")
+            self.counters_available = False
+            return
+        if output is None:
+            self.counters_available = False
+            return
+
+        now = time.monotonic()
+        labels = {}
+        for rule in self.rule.values():
+            if rule.type in COUNTED_SECTION_TYPES:
+                labels.setdefault(rule.label, []).append(rule)
+        if self._counters_time is None:
+            for label, rules in labels.items():
+                if len(rules) > 1:
+                    _LOGGER.warning("Luci: rules %s share the firewall label '%s'; "
+                                    "their counters cannot be told apart and are reported combined",
+                                    ", ".join(rule.id for rule in rules), label)
+        # Labels without a counter line (disabled rule, missing tools) stay None
+        totals = {label: None for label in labels}
+        for line in output.splitlines():
+            match = IPT_COUNTER_RE.match(line) or NFT_COUNTER_RE.search(line)
+            if match is None:
+                continue
+            label = COMMENT_ESCAPE_RE.sub(r'\1', match.group(3))
+            if label not in totals:
+                continue
+            if totals[label] is None:
+                totals[label] = [0, 0]
+            totals[label][0] += int(match.group(1))
+            totals[label][1] += int(match.group(2))
+
+        elapsed = now - self._counters_time if self._counters_time else None
+        for label, total in totals.items():
+            for rule in labels[label]:
+                if total is None:
+                    rule.packets = rule.bytes = None
+                    rule.packet_rate = rule.byte_rate = None
+                else:
+                    self._set_counters(rule, total[0], total[1], elapsed)
+        self._counters_time = now
+        self.counters_available = True
+
+    @staticmethod
+    def _set_counters(rule, packets, byte_count, elapsed):
+        """Store a counter sample on a rule and derive its rates."""
+        if elapsed and rule.packets is not None and packets >= rule.packets and byte_count >= rule.bytes:
+            rule.packet_rate = round((packets - rule.packets) / elapsed, 2)
+            rule.byte_rate = round((byte_count - rule.bytes) / elapsed, 2)
+        else:
+            # First sample, or counters were reset by a firewall reload
+            rule.packet_rate = None
+            rule.byte_rate = None
+        rule.packets = packets
+        rule.bytes = byte_count
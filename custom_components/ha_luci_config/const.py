@@ -15,3 +15,16 @@ DEFAULT_VERIFY_SSL = True
 CONN_TIMEOUT = 5.0
 
 CONF_RULE_IDS = "rule_ids"
+
+# Only these firewall sections are tagged with "!fw3:" / "!fw4:" comments
+COUNTED_SECTION_TYPES = ("rule", "redirect")
+MIN_TIME_BETWEEN_COUNTER_UPDATES = timedelta(seconds=10)
+
+# Dump the counters of both firewall backends in one exec: fw4 (nftables)
+# and fw3 (iptables) label their rules with "!fw4: <name>" / "!fw3: <name>".
+# Only the fw4 table is listed, without set contents, and the router filters
+# the output down to the labelled lines before sending it.
+FIREWALL_COUNTERS_CMD = (
+    "{ nft -t list table inet fw4; iptables-save -c; ip6tables-save -c; } 2>/dev/null"
+    " | grep -F '\"!fw'"
+)
@@ -0,0 +1,187 @@
+from datetime import timedelta
+import logging
+
+from homeassistant.components.sensor import ( # pylint: disable=import-error
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import ( # pylint: disable=import-error
+    CONF_HOST,
+    UnitOfDataRate,
+    UnitOfInformation,
+)
+from homeassistant.helpers.dispatcher import ( # pylint: disable=import-error
+    async_dispatcher_connect,
+)
+
+from .const import (
+    DOMAIN,
+    SIGNAL_STATE_UPDATED,
+    COUNTED_SECTION_TYPES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+SCAN_INTERVAL = timedelta(seconds=60)
+
+async def async_setup_entry(hass, config_entry, async_add_entities):
+    """Set up rule counter sensors dynamically."""
+
+    entities= []
+    rpc = hass.data[DOMAIN][config_entry.data.get(CONF_HOST)]
+
+    for key in rpc.rule:
+        if rpc.rule[key].type not in COUNTED_SECTION_TYPES:
+            continue
+        entities.append(LuciRulePacketsSensor(rpc, key))
+        entities.append(LuciRuleBytesSensor(rpc, key))
+        entities.append(LuciRulePacketRateSensor(rpc, key))
+        entities.append(LuciRuleByteRateSensor(rpc, key))
+
+    async_add_entities(entities, True)
+
+class LuciRuleCounterSensor(SensorEntity):
+    """ Base class for firewall rule counter sensors. """
+
+    def __init__(self, rpc, name):
+        """Initialize the sensor."""
+
+        _LOGGER.debug("New sensor: %s", name)
+
+        self._rpc = rpc
+        self.cfgname = name
+        self._rule = self._rpc.rule[self.cfgname]
+
+        self.host = self._rpc.host
+
+    async def async_added_to_hass(self):
+        """Register update dispatcher."""
+        async_dispatcher_connect(
+            self.hass, SIGNAL_STATE_UPDATED, self.async_schedule_update_ha_state
+        )
+
+    @property
+    def should_poll(self):
+        """Return the polling state."""
+        return True
+
+    @property
+    def available(self):
+        """Return False when the last counters fetch failed."""
+        return self._rpc.counters_available
+
+    @property
+    def state_class(self):
+        """Counters only grow until the firewall is reloaded."""
+        return SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def icon(self):
+        """Return the icon."""
+        return "mdi:counter"
+
+    def update(self):
+        """Update the counters of all rules; throttled to one call per cycle."""
+        self._rpc.update_counters()
+
+class LuciRulePacketsSensor(LuciRuleCounterSensor):
+    """Packets matched by a Luci firewall rule."""
+
+    @property
+    def unique_id(self):
+        return f"{self.host}_{self.cfgname}_packets"
+
+    @property
+    def name(self):
+        return "%s Rule Packets" % (self._rule.name)
+
+    @property
+    def native_unit_of_measurement(self):
+        return "packets"
+
+    @property
+    def native_value(self):
+        return self._rule.packets
+
+class LuciRuleBytesSensor(LuciRuleCounterSensor):
+    """Bytes matched by a Luci firewall rule."""
+
+    @property
+    def unique_id(self):
+        return f"{self.host}_{self.cfgname}_bytes"
+
+    @property
+    def name(self):
+        return "%s Rule Bytes" % (self._rule.name)
+
+    @property
+    def native_unit_of_measurement(self):
+        return UnitOfInformation.BYTES
+
+    @property
+    def device_class(self):
+        return SensorDeviceClass.DATA_SIZE
+
+    @property
+    def native_value(self):
+        return self._rule.bytes
+
+class LuciRulePacketRateSensor(LuciRuleCounterSensor):
+    """Packets per second matched by a Luci firewall rule."""
+
+    @property
+    def unique_id(self):
+        return f"{self.host}_{self.cfgname}_packet_rate"
+
+    @property
+    def name(self):
+        return "%s Rule Packet Rate" % (self._rule.name)
+
+    @property
+    def state_class(self):
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def icon(self):
+        """Return the icon."""
+        return "mdi:speedometer"
+
+    @property
+    def native_unit_of_measurement(self):
+        return "packets/s"
+
+    @property
+    def native_value(self):
+        return self._rule.packet_rate
+
+class LuciRuleByteRateSensor(LuciRuleCounterSensor):
+    """Bytes per second matched by a Luci firewall rule."""
+
+    @property
+    def unique_id(self):
+        return f"{self.host}_{self.cfgname}_byte_rate"
+
+    @property
+    def name(self):
+        return "%s Rule Byte Rate" % (self._rule.name)
+
+    @property
+    def state_class(self):
+        return SensorStateClass.MEASUREMENT
+
+    @property
+    def icon(self):
+        """Return the icon."""
+        return "mdi:speedometer"
+
+    @property
+    def native_unit_of_measurement(self):
+        return UnitOfDataRate.BYTES_PER_SECOND
+
+    @property
+    def device_class(self):
+        return SensorDeviceClass.DATA_RATE
+
+    @property
+    def native_value(self):
+        return self._rule.byte_rate